@@ -56,11 +56,11 @@ setup(
     install_requires=requirements,
     setup_requires=setup_requirements,
     zip_safe=True,
+    python_requires='>=3.6',
     license='MIT',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Natural Language :: English'
@@ -134,3 +134,118 @@ def test_toggle_msb_lsb(bl):
     bl.toggle_lsb()
     assert bl.get() == 0x00
 
+
+def test_apply_bits(bl):
+    bl.set(0x0f)
+
+    bl.apply_bits(set_mask=0x30, clear_mask=0x03, toggle_mask=0x81)
+    assert bl.get() == 0xbd
+
+
+def test_batch(bl):
+    with bl.batch():
+        bl.set_bit(0)
+        bl.set_msb()
+        bl._force_redraw()
+        assert str(bl['text']) == '00000000'
+
+    assert bl.get() == 0x81
+    bl._force_redraw()
+    assert str(bl['text']) == '10000001'
+
+
+def test_set_unchanged_value(bl):
+    bl.set(0x55)
+    bl._force_redraw()
+    bl['text'] = 'stale'
+
+    bl.set(0x55)
+    bl._force_redraw()
+    assert str(bl['text']) == 'stale'
+
+
+def test_truncation_warning_once(bl, caplog):
+    bl.apply_bits(set_mask=0x100)
+    bl.apply_bits(set_mask=0x200)
+
+    assert len(caplog.records) == 1
+
+
+def test_redraw_coalesced(bl):
+    bl.set_bit(0)
+    bl.set_bit(1)
+    bl.set_bit(2)
+    assert str(bl['text']) == '00000000'
+
+    bl._force_redraw()
+    assert str(bl['text']) == '00000111'
+
+
+def test_redraw_skipped_when_text_unchanged(bl):
+    bl['text'] = 'stale'
+
+    bl.toggle_bit(0)
+    bl.toggle_bit(0)
+    bl._force_redraw()
+    assert str(bl['text']) == 'stale'
+
+
+def test_negative_bit_position(bl):
+    with pytest.raises(ValueError):
+        bl.get_bit(-1)
+
+    with pytest.raises(ValueError):
+        bl.set_bit(-1)
+
+    with pytest.raises(ValueError):
+        bl.clear_bit(-1)
+
+    with pytest.raises(ValueError):
+        bl.toggle_bit(-1)
+
+    assert bl.get() == 0
+
+
+def test_creation_with_value_too_wide(root):
+    bl = BinaryLabel(root, value=0x1ff)
+    bl.grid()
+
+    assert bl.get() == 0xff
+    assert str(bl['text']) == '11111111'
+
+
+def test_creation_with_negative_value(root):
+    with pytest.raises(ValueError):
+        BinaryLabel(root, value=-1)
+
+    with pytest.raises(ValueError):
+        BinaryLabel(root, value=-300)
+
+
+def test_batch_set(root):
+    bl0 = BinaryLabel(root)
+    bl1 = BinaryLabel(root, prefix='0b')
+
+    BinaryLabel.batch_set([(bl0, 0x0f), (bl1, 0xf0)])
+
+    assert bl0.get() == 0x0f
+    assert str(bl0['text']) == '00001111'
+    assert bl1.get() == 0xf0
+    assert str(bl1['text']) == '0b11110000'
+
+
+def test_byte_label(root):
+    from tk_tools import ByteLabel
+
+    bl = ByteLabel(root, value=0x55)
+    bl.grid()
+
+    assert isinstance(bl, BinaryLabel)
+    assert bl.get() == 0x55
+
+
+def test_change_value_negative(bl):
+    with pytest.raises(ValueError):
+        bl.set(-1)
+
+    assert bl.get() == 0
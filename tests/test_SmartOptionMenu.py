@@ -89,3 +89,127 @@ def test_add_callback_with_param(som):
     som.set('2')
 
     assert item_value == 6
+
+
+def test_callback_type_error_not_retried(root):
+    calls = []
+
+    def callback():
+        calls.append(None)
+        raise TypeError
+
+    root.report_callback_exception = lambda *args: None
+
+    som = SmartOptionMenu(root, ['1', '2', '3'], callback=callback)
+    som.grid()
+
+    som.set('2')
+
+    assert len(calls) == 1
+
+
+def test_remove_callback(som):
+    item_value = 0
+
+    def callback():
+        nonlocal item_value
+        item_value += 1
+
+    som.add_callback(callback)
+    som.set('2')
+
+    som.remove_callback(callback)
+    som.set('3')
+
+    assert item_value == 1
+
+    with pytest.raises(ValueError):
+        som.remove_callback(callback)
+
+
+def test_add_callback_method_with_param(som):
+    class Receiver:
+        def __init__(self):
+            self.values = []
+
+        def callback(self, value):
+            self.values.append(value)
+
+    receiver = Receiver()
+    som.add_callback(receiver.callback)
+
+    som.set('2')
+
+    assert receiver.values == ['2']
+
+
+def test_add_callback_default_param(som):
+    values = []
+
+    def callback(value=None):
+        values.append(value)
+
+    som.add_callback(callback)
+
+    som.set('2')
+
+    assert values == [None]
+
+
+def test_remove_callback_bound_method(som):
+    class Receiver:
+        def __init__(self):
+            self.count = 0
+
+        def callback(self):
+            self.count += 1
+
+    receiver = Receiver()
+    som.add_callback(receiver.callback)
+    som.set('2')
+
+    som.remove_callback(receiver.callback)
+    som.set('3')
+
+    assert receiver.count == 1
+
+
+def test_callback_removing_itself(som):
+    calls = []
+
+    def one_shot():
+        calls.append('one_shot')
+        som.remove_callback(one_shot)
+
+    def callback():
+        calls.append('callback')
+
+    som.add_callback(one_shot)
+    som.add_callback(callback)
+
+    som.set('2')
+    som.set('3')
+
+    assert calls == ['one_shot', 'callback', 'callback']
+
+
+def test_callback_error_does_not_stop_others(root):
+    errors = []
+    calls = []
+
+    def failing():
+        raise RuntimeError
+
+    def callback():
+        calls.append(None)
+
+    root.report_callback_exception = lambda *args: errors.append(args[0])
+
+    som = SmartOptionMenu(root, ['1', '2', '3'])
+    som.add_callback(failing)
+    som.add_callback(callback)
+
+    som.set('2')
+
+    assert errors == [RuntimeError]
+    assert len(calls) == 1
@@ -0,0 +1,38 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import SmartSpinBox
+
+from tests.test_basic import root
+
+
+def test_creation(root):
+    SmartSpinBox(root, entry_type='int', from_=0, to=5)
+
+
+def test_invalid_entry_type(root):
+    with pytest.raises(ValueError):
+        SmartSpinBox(root, entry_type='complex')
+
+
+def test_callback_with_unreadable_value(root):
+    errors = []
+    calls = []
+
+    def callback():
+        calls.append(None)
+
+    def callback_with_value(value):
+        calls.append(value)
+
+    root.report_callback_exception = lambda *args: errors.append(args[0])
+
+    ssb = SmartSpinBox(root, entry_type='int', from_=0, to=5)
+    ssb.add_callback(callback_with_value)
+    ssb.add_callback(callback)
+
+    ssb._var.set('-')
+
+    assert errors == [tk.TclError]
+    assert calls == [None]
@@ -1,9 +1,40 @@
 import tkinter as tk
 import tkinter.ttk as ttk
 import logging
+import inspect
+import sys
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+_UNREAD = object()
+
+_VAR_TYPES = {
+    'str': tk.StringVar,
+    'int': tk.IntVar,
+    'float': tk.DoubleVar
+}
+
+
+def _takes_value(callback: callable):
+    """
+    Determines whether a callback expects the current value as
+    an argument, or whether it should be called with no arguments.
+
+    :param callback: callable function
+    :return: True if the callback has a required positional parameter
+    """
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+
+    positional = (inspect.Parameter.POSITIONAL_ONLY,
+                  inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+    return any(p.default is p.empty and p.kind in positional
+               for p in parameters)
+
 
 class SmartWidget(ttk.Frame):
     """
@@ -14,6 +45,14 @@ class SmartWidget(ttk.Frame):
         super().__init__(self._parent)
 
         self._var = None
+        self._callbacks = []
+        self._trace_installed = False
+
+    def _bind_var(self):
+        # bind get and set straight to the variable, avoiding the method
+        # indirection; called by the subclasses once _var is assigned
+        self.get = self._var.get
+        self.set = self._var.set
 
     def add_callback(self, callback: callable):
         """
@@ -22,13 +61,44 @@ class SmartWidget(ttk.Frame):
         :param callback: callable function
         :return: None
         """
-        def internal_callback(*args):
-            try:
-                callback()
-            except TypeError:
-                callback(self.get())
+        self._callbacks.append((callback, _takes_value(callback)))
+
+        if not self._trace_installed:
+            self._var.trace_add('write', self._dispatch)
+            self._trace_installed = True
+
+    def remove_callback(self, callback: callable):
+        """
+        Remove a callback previously added using `add_callback`
+
+        :param callback: callable function
+        :return: None
+        """
+        for i, (cb, _) in enumerate(self._callbacks):
+            if cb == callback:
+                del self._callbacks[i]
+                return
 
-        self._var.trace('w', internal_callback)
+        raise ValueError('callback not found')
+
+    def _dispatch(self, *args):
+        value = _UNREAD
+
+        # iterate over a copy so that callbacks may remove themselves,
+        # and report errors individually so one failing callback does
+        # not prevent the others from running
+        for callback, takes_value in tuple(self._callbacks):
+            try:
+                if takes_value:
+                    # read the value only once, and only when needed, since
+                    # a partially typed number cannot be read at all
+                    if value is _UNREAD:
+                        value = self.get()
+                    callback(value)
+                else:
+                    callback()
+            except Exception:
+                self._root().report_callback_exception(*sys.exc_info())
 
     def get(self):
         """
@@ -80,13 +150,10 @@ class SmartOptionMenu(SmartWidget):
                                          *options)
         self.option_menu.grid(row=0, column=0)
 
+        self._bind_var()
+
         if callback is not None:
-            def internal_callback(*args):
-                try:
-                    callback()
-                except TypeError:
-                    callback(self.get())
-            self._var.trace('w', internal_callback)
+            self.add_callback(callback)
 
 
 class SmartSpinBox(SmartWidget):
@@ -116,28 +183,19 @@ class SmartSpinBox(SmartWidget):
         self._parent = parent
         super().__init__(self._parent)
 
-        sb_options = options.copy()
-
-        if entry_type == 'str':
-            self._var = tk.StringVar()
-        elif entry_type == 'int':
-            self._var = tk.IntVar()
-        elif entry_type == 'float':
-            self._var = tk.DoubleVar()
-        else:
+        var_type = _VAR_TYPES.get(entry_type)
+        if var_type is None:
             raise ValueError('Entry type must be "str", "int", or "float"')
 
-        sb_options['textvariable'] = self._var
-        self._spin_box = tk.Spinbox(self, **sb_options)
+        self._var = var_type()
+
+        self._spin_box = tk.Spinbox(self, textvariable=self._var, **options)
         self._spin_box.grid()
 
+        self._bind_var()
+
         if callback is not None:
-            def internal_callback(*args):
-                try:
-                    callback()
-                except TypeError:
-                    callback(self.get())
-            self._var.trace('w', internal_callback)
+            self.add_callback(callback)
 
 
 class SmartCheckbutton(SmartWidget):
@@ -171,19 +229,17 @@ class SmartCheckbutton(SmartWidget):
         self._cb = tk.Checkbutton(self, variable=self._var, **options)
         self._cb.grid()
 
+        self._bind_var()
+
         if callback is not None:
-            def internal_callback(*args):
-                try:
-                    callback()
-                except TypeError:
-                    callback(self.get())
-            self._var.trace('w', internal_callback)
+            self.add_callback(callback)
 
 
 class BinaryLabel(ttk.Label):
     """
     Displays a value binary. Provides methods for
-    easy manipulation of bit values.::
+    easy manipulation of bit values. Changes to the value are
+    shown on the next idle pass of the event loop.::
 
         # create the label and grid
         bl = BinaryLabel(root, 255)
@@ -198,13 +254,27 @@ class BinaryLabel(ttk.Label):
     """
     def __init__(self, parent, value: int=0, prefix: str="", bit_width=8,
                  **options):
+        if value < 0:
+            raise ValueError('the value {} is negative'.format(value))
+
         self._parent = parent
         super().__init__(self._parent, **options)
 
-        self._value = value
         self._prefix = prefix
         self._bit_width = bit_width
-        self._text_update()
+        self._mask = (1 << bit_width) - 1
+        self._fmt_spec = "0" + str(bit_width) + "b"
+        self._bit_masks = tuple(1 << i for i in range(bit_width))
+        self._msb_pos = bit_width - 1
+        self._suspend_update = 0
+        self._dirty = False
+        self._warned = False
+        self._pending_redraw = None
+        self._last_text = None
+
+        self._warn_width(value)
+        self._value = value & self._mask
+        self._do_redraw()
 
     def get(self):
         """
@@ -221,19 +291,127 @@ class BinaryLabel(ttk.Label):
         :param value:
         :return: None
         """
-        max_value = int(''.join(['1' for _ in range(self._bit_width)]), 2)
+        if value < 0:
+            raise ValueError('the value {} is negative'.format(value))
 
-        if value > max_value:
+        if not self._check_width(value):
             raise ValueError('the value {} is larger than '
-                             'the maximum value {}'.format(value, max_value))
+                             'the maximum value {}'.format(value, self._mask))
+
+        value &= self._mask
+        if value == self._value:
+            return
 
         self._value = value
         self._text_update()
 
+    @classmethod
+    def batch_set(cls, pairs):
+        """
+        Set the values of several labels, then redraw all of them
+        in a single idle pass.::
+
+            BinaryLabel.batch_set([(bl0, 0x12), (bl1, 0x34)])
+
+        :param pairs: an iterable of (label, value) tuples
+        :return: None
+        """
+        label = None
+        for label, value in pairs:
+            label.set(value)
+
+        if label is not None:
+            label.update_idletasks()
+
+    def destroy(self):
+        """
+        Cancels any pending redraw, then destroys the label
+
+        :return: None
+        """
+        if self._pending_redraw is not None:
+            self.after_cancel(self._pending_redraw)
+            self._pending_redraw = None
+
+        super().destroy()
+
+    def _check_width(self, value: int):
+        return 0 <= value and value.bit_length() <= self._bit_width
+
+    def _warn_width(self, value: int):
+        if self._warned or self._check_width(value):
+            return
+
+        self._warned = True
+        if value < 0:
+            logger.warning('the value {} is negative and will be masked '
+                           'to {} bits'.format(value, self._bit_width))
+        else:
+            logger.warning('the value {} is wider than {} bits and will '
+                           'be truncated'.format(value, self._bit_width))
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager which defers the display update until
+        the block exits, so that several bit operations result
+        in a single redraw.::
+
+            with bl.batch():
+                bl.set_bit(0)
+                bl.clear_bit(3)
+                bl.toggle_msb()
+
+        :return: None
+        """
+        self._suspend_update += 1
+        try:
+            yield self
+        finally:
+            self._suspend_update -= 1
+            if self._suspend_update == 0 and self._dirty:
+                self._text_update()
+
+    def apply_bits(self, set_mask: int=0, clear_mask: int=0,
+                   toggle_mask: int=0):
+        """
+        Applies several bit operations at once, updating the
+        display only one time.  The set mask is applied first,
+        followed by the clear mask and finally the toggle mask.
+
+        :param set_mask: bits to set
+        :param clear_mask: bits to clear
+        :param toggle_mask: bits to toggle
+        :return: None
+        """
+        value = ((self._value | set_mask) & ~clear_mask) ^ toggle_mask
+        self._warn_width(value)
+        self._value = value & self._mask
+        self._text_update()
+
     def _text_update(self):
-        self["text"] = \
-            self._prefix +\
-            str(bin(self._value))[2:].zfill(self._bit_width)[-self._bit_width:]
+        if self._suspend_update > 0:
+            self._dirty = True
+            return
+
+        self._dirty = False
+        if self._pending_redraw is None:
+            self._pending_redraw = self.after_idle(self._do_redraw)
+
+    def _force_redraw(self):
+        # update_idletasks() flushes the pending redraw without
+        # re-entering the event loop the way update() would
+        self.update_idletasks()
+
+    def _do_redraw(self):
+        self._pending_redraw = None
+
+        text = self._prefix + format(self._value, self._fmt_spec)
+        if text == self._last_text:
+            return
+
+        self["text"] = text
+        self._last_text = text
 
     def get_bit(self, position: int):
         """
@@ -243,13 +421,10 @@ class BinaryLabel(ttk.Label):
         :return: the value at position as a integer
         """
 
-        if position > (self._bit_width - 1):
-            raise ValueError('position greater than the bit width')
+        if not 0 <= position <= self._msb_pos:
+            raise ValueError('position outside of the bit width')
 
-        if self._value & (1 << position):
-            return 1
-        else:
-            return 0
+        return (self._value >> position) & 1
 
     def toggle_bit(self, position: int):
         """
@@ -258,10 +433,10 @@ class BinaryLabel(ttk.Label):
         :param position: integer between 0 and 7, inclusive
         :return: None
         """
-        if position > (self._bit_width - 1):
-            raise ValueError('position greater than the bit width')
+        if not 0 <= position <= self._msb_pos:
+            raise ValueError('position outside of the bit width')
 
-        self._value ^= (1 << position)
+        self._value ^= self._bit_masks[position]
         self._text_update()
 
     def set_bit(self, position: int):
@@ -271,10 +446,10 @@ class BinaryLabel(ttk.Label):
         :param position: integer between 0 and 7, inclusive
         :return: None
         """
-        if position > (self._bit_width - 1):
-            raise ValueError('position greater than the bit width')
+        if not 0 <= position <= self._msb_pos:
+            raise ValueError('position outside of the bit width')
 
-        self._value |= (1 << position)
+        self._value |= self._bit_masks[position]
         self._text_update()
 
     def clear_bit(self, position: int):
@@ -284,10 +459,10 @@ class BinaryLabel(ttk.Label):
         :param position: integer between 0 and 7, inclusive
         :return: None
         """
-        if position > (self._bit_width - 1):
-            raise ValueError('position greater than the bit width')
+        if not 0 <= position <= self._msb_pos:
+            raise ValueError('position outside of the bit width')
 
-        self._value &= ~(1 << position)
+        self._value &= ~self._bit_masks[position]
         self._text_update()
 
     def get_msb(self):
@@ -295,14 +470,14 @@ class BinaryLabel(ttk.Label):
         Returns the most significant bit as an integer
         :return: the MSB
         """
-        return self.get_bit(self._bit_width-1)
+        return self.get_bit(self._msb_pos)
 
     def toggle_msb(self):
         """
         Changes the most significant bit
         :return: None
         """
-        self.toggle_bit(self._bit_width-1)
+        self.toggle_bit(self._msb_pos)
 
     def get_lsb(self):
         """
@@ -316,14 +491,14 @@ class BinaryLabel(ttk.Label):
         Sets the most significant bit
         :return: None
         """
-        self.set_bit(self._bit_width-1)
+        self.set_bit(self._msb_pos)
 
     def clear_msb(self):
         """
         Clears the most significant bit
         :return: None
         """
-        self.clear_bit(self._bit_width-1)
+        self.clear_bit(self._msb_pos)
 
     def toggle_lsb(self):
         """